@@ -1,5 +1,6 @@
-from collections import OrderedDict
-from typing import Dict, Optional, Union
+from functools import lru_cache
+from itertools import chain
+from typing import Callable, Dict, Iterable, Optional, Type, Union
 
 from spacy.language import Language
 from spacy.tokens import Doc, Span, Token
@@ -43,9 +44,10 @@ class ConllFormatter:
              `CoNLL format`_.
            - in `Doc`: all its sentences' `conll_str` combined and separated by new lines.
        - `conll_pd`: `pandas` representation of the CoNLL format
-           - in `Token`: a `Series` representation of this token's CoNLL properties.
+           - in `Token`: a `Series` representation of this token's CoNLL properties, taken from the Doc's
+             `DataFrame` when accessed.
            - in sentence `Span`: a `DataFrame` representation of this sentence, with the CoNLL names as column
-             headers.
+             headers, taken from the Doc's `DataFrame` when accessed.
            - in `Doc`: a concatenation of its sentences' `DataFrame`'s, leading to a new a `DataFrame` whose
              index is reset.
        """
@@ -77,17 +79,44 @@ class ConllFormatter:
         """
         # To get the morphological info, we need a tag map
         self._tagmap = nlp.Defaults.tag_map
+        # Drop the numeric properties (e.g. the POS attribute ID) from the tag map once, rather than per token
+        self._filtered_tagmap = {
+            tag: [(prop, val) for prop, val in feats.items() if not self._is_number(prop)]
+            for tag, feats in (self._tagmap or {}).items()
+        }
+        # Expanded features only depend on the tag, so cache them
+        self._morph_cache = {}
+        # Whether a dependency label denotes the root, filled per label as they are encountered
+        self._is_root_dep = {"ROOT": True, "root": True}
 
         # Set custom attribute names
         self._ext_names = {"conll_str": "conll_str", "conll": "conll", "conll_pd": "conll_pd"}
         if ext_names:
-            self._ext_names = self._merge_dicts_strict(self._ext_names, ext_names)
+            unknown_names = ext_names.keys() - self._ext_names.keys()
+            if unknown_names:
+                raise KeyError(
+                    f"Unknown extension name(s) {sorted(unknown_names)}."
+                    f" Valid keys are {list(self._ext_names.keys())}"
+                )
+            self._ext_names.update(ext_names)
 
         self._conversion_maps = conversion_maps
+        # Only the fields that actually have a conversion map need to be looked at for every token
+        self._map_keys = (
+            tuple(k for k in conversion_maps if k in CONLL_FIELD_NAMES)
+            if conversion_maps
+            else ()
+        )
 
         self.include_headers = include_headers
         self.disable_pandas = disable_pandas
-        # Initialize extensions
+        # Initialize extensions, and keep track of which ones this formatter needs
+        ext_keys = ("conll", "conll_str")
+        if PD_AVAILABLE and not self.disable_pandas:
+            ext_keys += ("conll_pd",)
+        self._extensions = tuple(
+            (obj, self._ext_names[k]) for obj in (Doc, Span, Token) for k in ext_keys
+        )
         self._set_extensions()
 
     def __call__(self, doc: Doc):
@@ -101,63 +130,154 @@ class ConllFormatter:
         # multiprocessing in Windows
         # see: https://github.com/explosion/spaCy/issues/4903
         # fixed in: https://github.com/explosion/spaCy/pull/5006
-        # Leaving this here for now, for older versions of spaCy
-        self._set_extensions()
-
-        for sent_idx, sent in enumerate(doc.sents, 1):
-            self._set_span_conll(sent, sent_idx)
-
-        doc._.set(
-            self._ext_names["conll"], [s._.get(self._ext_names["conll"]) for s in doc.sents]
-        )
-        doc._.set(
-            self._ext_names["conll_str"],
-            "\n".join([s._.get(self._ext_names["conll_str"]) for s in doc.sents]),
-        )
-
-        if PD_AVAILABLE and not self.disable_pandas:
-            doc._.set(
-                self._ext_names["conll_pd"],
-                pd.concat(
-                    [s._.get(self._ext_names["conll_pd"]) for s in doc.sents]
-                ).reset_index(drop=True),
-            )
+        # Leaving this here for now, for older versions of spaCy. Only checking whether they are
+        # registered is cheaper than going through _set_extensions for every Doc
+        if not self._has_extensions():
+            self._set_extensions()
+
+        return self._set_doc_conll(doc)
+
+    def pipe(self, stream: Iterable[Doc], batch_size: int = 128):
+        """Processes a stream of Docs, e.g. when using `nlp.pipe`. The setup that `__call__` does for every
+           Doc is only done once for the whole stream.
+        :param stream: the input Docs
+        :param batch_size: the number of Docs to buffer. Only present for compatibility with spaCy's `pipe`
+               interface, as Docs are processed one by one
+        :return: a generator of the modified Docs containing the newly added extensions
+        """
+        # See __call__
+        if not self._has_extensions():
+            self._set_extensions()
 
-        return doc
+        for doc in stream:
+            yield self._set_doc_conll(doc)
 
     def _get_morphology(self, tag: str):
-        """Expands a tag into its morphological features by using a tagmap.
+        """Expands a tag into its morphological features by using a tagmap, and caches the result in
+           `self._morph_cache`. Callers are expected to look in that cache first, and to skip this altogether
+           when there is no tag map.
         :param tag: the tag to expand
         :return: a string entailing the tag's morphological features
         """
-        if not self._tagmap or tag not in self._tagmap:
-            return "_"
+        if tag not in self._filtered_tagmap:
+            morph = "_"
         else:
-            feats = [
-                f"{prop}={val}"
-                for prop, val in self._tagmap[tag].items()
-                if not self._is_number(prop)
-            ]
-            if feats:
-                return "|".join(feats)
-            else:
-                return "_"
+            feats = [f"{prop}={val}" for prop, val in self._filtered_tagmap[tag]]
+            morph = "|".join(feats) if feats else "_"
+
+        self._morph_cache[tag] = morph
+
+        return morph
+
+    def _get_token_conll(
+        self, token: Token, token_idx: int = 1, sent_start_i: Optional[int] = None
+    ):
+        """Gets a token's properties according to the CoNLL-U format. Setting them on the token is left to
+           `_set_span_conll`, which can do so without repeatedly looking up the extension names.
+        :param token: a spaCy Token
+        :param token_idx: optional index, corresponding to the n-th token in the sentence Span
+        :param sent_start_i: optional index of the first token of the token's sentence in the parent Doc.
+               Passing it avoids looking up the sentence for every token
+        :return: the token's CoNLL dict and its CoNLL string
+        """
+        # Read the token's string attributes only once
+        tag = token.tag_
+        dep = token.dep_
+
+        # Remember per label whether it is the root, so that labels are not normalised for every token
+        is_root = self._is_root_dep.get(dep)
+        if is_root is None:
+            is_root = self._is_root_dep[dep] = dep.lower().strip() == "root"
+
+        if is_root:
+            head_idx = 0
+        else:
+            if sent_start_i is None:
+                sent_start_i = token.sent.start
+            head_idx = token.head.i + 1 - sent_start_i
+
+        # Only expand tags that are not in the cache yet, and skip the tag map altogether when
+        # there is none
+        if self._filtered_tagmap:
+            feats = self._morph_cache.get(tag)
+            if feats is None:
+                feats = self._get_morphology(tag)
+        else:
+            feats = "_"
+
+        token_conll_d = {
+            "id": token_idx,
+            "form": token.text,
+            "lemma": token.lemma_,
+            "upostag": token.pos_,
+            "xpostag": tag,
+            "feats": feats,
+            "head": head_idx,
+            "deprel": dep,
+            "deps": "_",
+            "misc": "_" if token.whitespace_ else "SpaceAfter=No",
+        }
+
+        # convert properties if needed
+        if self._map_keys:
+            self._map_conll(token_conll_d)
+
+        # read from the dict rather than the token, so that converted values are used
+        token_conll_str = (
+            f"{token_conll_d['id']}\t{token_conll_d['form']}\t{token_conll_d['lemma']}\t"
+            f"{token_conll_d['upostag']}\t{token_conll_d['xpostag']}\t{token_conll_d['feats']}\t"
+            f"{token_conll_d['head']}\t{token_conll_d['deprel']}\t{token_conll_d['deps']}\t"
+            f"{token_conll_d['misc']}\n"
+        )
+
+        return token_conll_d, token_conll_str
+
+    def _has_extensions(self):
+        """Checks whether all the extensions that this formatter needs are registered. They may not be when
+           another formatter (e.g. with different extension names) registered its own, or when the Underscore
+           registry was reset.
+        :return: whether all the extensions are registered
+        """
+        return all(obj.has_extension(name) for obj, name in self._extensions)
 
     def _map_conll(self, token_conll_d: Dict[str, Union[str, int]]):
-        """Maps labels according to a given `self._conversion_maps`.
+        """Maps labels in-place according to a given `self._conversion_maps`.
             This can be useful when users want to change the output labels of a
             model to their own tagset.
 
         :param token_conll_d: a token's conll representation as dict (field_name: value)
-        :return: the modified dict where the labels have been replaced according to the converison maps
         """
-        for k, v in token_conll_d.items():
-            try:
-                token_conll_d[k] = self._conversion_maps[k][v]
-            except KeyError:
-                continue
+        for k in self._map_keys:
+            conversion_map = self._conversion_maps[k]
+            v = token_conll_d[k]
+            if v in conversion_map:
+                token_conll_d[k] = conversion_map[v]
+
+    def _set_doc_conll(self, doc: Doc):
+        """Sets a Doc's properties, and those of its sentences and tokens, according to the CoNLL-U format.
+        :param doc: the input Doc
+        :return: the modified Doc containing the newly added extensions
+        """
+        ext_conll = self._ext_names["conll"]
+        ext_conll_str = self._ext_names["conll_str"]
+
+        doc_conll = []
+        doc_conll_strs = []
+        for sent_idx, sent in enumerate(doc.sents, 1):
+            sent_conll, sent_conll_str = self._set_span_conll(sent, sent_idx)
+            doc_conll.append(sent_conll)
+            doc_conll_strs.append(sent_conll_str)
+
+        doc._.set(ext_conll, doc_conll)
+        doc._.set(ext_conll_str, "\n".join(doc_conll_strs))
+
+        if PD_AVAILABLE and not self.disable_pandas:
+            # Build the Doc's DataFrame in one go rather than concatenating the sentences' DataFrames
+            doc._.set(
+                self._ext_names["conll_pd"], self._conll_to_pd(chain.from_iterable(doc_conll))
+            )
 
-        return token_conll_d
+        return doc
 
     def _set_extensions(self):
         """Sets the default extensions if they do not exist yet."""
@@ -169,72 +289,62 @@ class ConllFormatter:
 
             if PD_AVAILABLE and not self.disable_pandas:
                 if not obj.has_extension(self._ext_names["conll_pd"]):
-                    obj.set_extension(self._ext_names["conll_pd"], default=None)
+                    if obj is Doc:
+                        obj.set_extension(self._ext_names["conll_pd"], default=None)
+                    else:
+                        # Sentences' and tokens' pandas objects are rarely used, so only build them
+                        # when requested. The getter only depends on the extension's name, so it can
+                        # be shared by all formatters
+                        getter = _get_conll_pd_getter(obj, self._ext_names["conll_pd"])
+                        obj.set_extension(self._ext_names["conll_pd"], getter=getter)
 
     def _set_span_conll(self, span: Span, span_idx: int = 1):
         """Sets a span's properties according to the CoNLL-U format.
         :param span: a spaCy Span
         :param span_idx: optional index, corresponding to the n-th sentence
                          in the parent Doc
+        :return: the span's CoNLL list of dicts and its CoNLL string
         """
-        span_conll_str = ""
-        if self.include_headers:
-            span_conll_str += f"# sent_id = {span_idx}\n# text = {span.text}\n"
+        # Avoid looking up the extension names and the token method for every token
+        ext_conll = self._ext_names["conll"]
+        ext_conll_str = self._ext_names["conll_str"]
 
-        for token_idx, token in enumerate(span, 1):
-            self._set_token_conll(token, token_idx)
-
-        span._.set(self._ext_names["conll"], [t._.get(self._ext_names["conll"]) for t in span])
-        span_conll_str += "".join([t._.get(self._ext_names["conll_str"]) for t in span])
-        span._.set(self._ext_names["conll_str"], span_conll_str)
+        get_token_conll = self._get_token_conll
+        sent_start_i = span.start
 
-        if PD_AVAILABLE and not self.disable_pandas:
-            span._.set(
-                self._ext_names["conll_pd"],
-                pd.DataFrame([t._.get(self._ext_names["conll"]) for t in span]),
-            )
+        span_conll = []
+        span_conll_strs = []
+        for token_idx, token in enumerate(span, 1):
+            token_conll_d, token_conll_str = get_token_conll(token, token_idx, sent_start_i)
+            token._.set(ext_conll, token_conll_d)
+            token._.set(ext_conll_str, token_conll_str)
+            span_conll.append(token_conll_d)
+            span_conll_strs.append(token_conll_str)
 
-    def _set_token_conll(self, token: Token, token_idx: int = 1):
-        """Sets a token's properties according to the CoNLL-U format.
-        :param token: a spaCy Token
-        :param token_idx: optional index, corresponding to the n-th token in the sentence Span
-        """
-        if token.dep_.lower().strip() == "root":
-            head_idx = 0
+        tokens_conll_str = "".join(span_conll_strs)
+        if self.include_headers:
+            span_conll_str = f"# sent_id = {span_idx}\n# text = {span.text}\n{tokens_conll_str}"
         else:
-            head_idx = token.head.i + 1 - token.sent[0].i
-
-        token_conll = (
-            token_idx,
-            token.text,
-            token.lemma_,
-            token.pos_,
-            token.tag_,
-            self._get_morphology(token.tag_),
-            head_idx,
-            token.dep_,
-            "_",
-            "_" if token.whitespace_ else "SpaceAfter=No",
-        )
+            span_conll_str = tokens_conll_str
 
-        # turn field name values (keys) and token values (values) into dict
-        token_conll_d = OrderedDict(zip(CONLL_FIELD_NAMES, token_conll))
+        span._.set(ext_conll, span_conll)
+        span._.set(ext_conll_str, span_conll_str)
 
-        # convert properties if needed
-        if self._conversion_maps:
-            token_conll_d = self._map_conll(token_conll_d)
+        return span_conll, span_conll_str
 
-        token._.set(self._ext_names["conll"], token_conll_d)
-        token_conll_str = "\t".join(map(str, token_conll_d.values())) + "\n"
-        token._.set(self._ext_names["conll_str"], token_conll_str)
-
-        if PD_AVAILABLE and not self.disable_pandas:
-            token._.set(self._ext_names["conll_pd"], pd.Series(token_conll_d))
+    @staticmethod
+    def _conll_to_pd(token_conll_ds: Iterable[Dict[str, Union[str, int]]]):
+        """Builds a DataFrame from tokens' CoNLL dicts. The columns are handed to pandas directly, which
+           avoids that pandas has to scan and unify the keys of every row dict.
+        :param token_conll_ds: the tokens' CoNLL dicts, one per row
+        :return: a DataFrame with the CoNLL field names as column headers
+        """
+        cols = zip(*(token_conll_d.values() for token_conll_d in token_conll_ds))
 
-        return token
+        return pd.DataFrame(dict(zip(CONLL_FIELD_NAMES, map(list, cols))), copy=False)
 
     @staticmethod
-    def _is_number(s: str):
+    def _is_number(s: Union[int, str]):
         """Checks whether a string is actually a number.
         :param s: string to test
         :return: whether or not 's' is a number
@@ -245,20 +355,38 @@ class ConllFormatter:
         except ValueError:
             return False
 
-    @staticmethod
-    def _merge_dicts_strict(d1: Dict, d2: Dict):
-        """Merge two dicts in a strict manner, i.e. the second dict overwrites keys
-           of the first dict but all keys in the second dict have to be present in
-           the first dict.
-        :param d1: base dict which will be overwritten
-        :param d2: dict with new values that will overwrite d1
-        :return: the merged dict (but d1 will be modified in-place anyway!)
-        """
-        for k, v in d2.items():
-            if k not in d1:
-                raise KeyError(
-                    f"This key does not exist in the original dict. Valid keys are {list(d1.keys())}"
-                )
-            d1[k] = v
 
-        return d1
+@lru_cache(maxsize=None)
+def _get_conll_pd_getter(
+    obj: Type[Union[Span, Token]], ext_conll_pd: str
+) -> Callable[[Union[Span, Token]], Optional[Union["pd.DataFrame", "pd.Series"]]]:
+    """Creates the getter for a sentence's or token's `conll_pd` extension. Its pandas object is taken from its
+       Doc's DataFrame, so that the getter does not depend on the formatter (nor its extension names) that
+       processed the Doc. Getters are cached, so the same extension always gets the same getter.
+    :param obj: the class of the extension, Span or Token
+    :param ext_conll_pd: the name of the `conll_pd` extension
+    :return: the getter, which returns a DataFrame representation of the sentence or a Series representation of
+             the token's CoNLL properties. It returns None if the Doc does not have a DataFrame (e.g. because it
+             was processed with `disable_pandas=True`), or if the Span is not a sentence
+    """
+    if obj is Span:
+
+        def getter(span: Span):
+            doc_conll_pd = span.doc._.get(ext_conll_pd)
+            if doc_conll_pd is None or not len(span):
+                return None
+
+            sent = span[0].sent
+            if sent.start != span.start or sent.end != span.end:
+                return None
+
+            return doc_conll_pd.iloc[span.start : span.end].reset_index(drop=True)
+
+    else:
+
+        def getter(token: Token):
+            doc_conll_pd = token.doc._.get(ext_conll_pd)
+
+            return None if doc_conll_pd is None else doc_conll_pd.iloc[token.i].rename(None)
+
+    return getter
@@ -1,4 +1,5 @@
 import pytest
+from spacy.tests.util import get_doc
 from spacy.tokens.underscore import Underscore
 
 from spacy_conll import init_parser
@@ -68,6 +69,20 @@ def multi_sent():
     return "A cookie is a baked or cooked food that is typically small, flat and sweet. It usually contains flour, sugar and some type of oil or fat. It may include other ingredients such as raisins, oats, chocolate chips, nuts, etc."
 
 
+def hand_built_doc(nlp):
+    # Doc with tags and a parse that does not need any parser, so that the formatter can be tested by itself
+    words = ["He", "wanted", "cookies", ".", "It", "is", "sweet", "!"]
+    heads = [1, 0, -1, -2, 1, 0, -1, -2]
+    deps = ["nsubj", "ROOT", "dobj", "punct", "nsubj", "ROOT", "acomp", "punct"]
+    tags = ["PRP", "VBD", "NNS", ".", "PRP", "VBZ", "JJ", "."]
+    return get_doc(nlp.vocab, words=words, heads=heads, deps=deps, tags=tags)
+
+
+@pytest.fixture
+def make_hand_built_doc():
+    yield hand_built_doc
+
+
 @pytest.fixture(params=[single_sent, multi_sent])
 def text(request):
     yield request.param
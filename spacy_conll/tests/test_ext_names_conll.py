@@ -1,3 +1,7 @@
+import pytest
+import spacy
+
+from spacy_conll import ConllFormatter
 from spacy_conll.formatter import CONLL_FIELD_NAMES
 
 
@@ -20,3 +24,8 @@ def test_ext_names_token_conll(spacy_ext_names_doc):
         assert token._.conllu is not None
         assert isinstance(token._.conllu, dict)
         assert CONLL_FIELD_NAMES == list(token._.conllu.keys())
+
+
+def test_ext_names_unknown():
+    with pytest.raises(KeyError):
+        ConllFormatter(spacy.blank("en"), ext_names={"conll_json": "json"})
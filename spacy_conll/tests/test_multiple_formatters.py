@@ -0,0 +1,117 @@
+import spacy
+from pandas import DataFrame, Series
+from spacy.tokens import Token
+from spacy.tokens.underscore import Underscore
+
+from spacy_conll import ConllFormatter
+from spacy_conll.formatter import CONLL_FIELD_NAMES
+
+# Extensions are shared by all formatters, so these tests use several formatters in a single test.
+# They use hand-built Docs so that they do not depend on a parser.
+
+
+def test_token_conll_pd_different_ext_names(make_hand_built_doc):
+    nlp = spacy.blank("en")
+    formatter = ConllFormatter(nlp)
+    doc = formatter(make_hand_built_doc(nlp))
+    other_formatter = ConllFormatter(nlp, ext_names={"conll": "cc", "conll_str": "cs"})
+    other_doc = other_formatter(make_hand_built_doc(nlp))
+
+    for token in doc:
+        assert isinstance(token._.conll_pd, Series)
+        assert CONLL_FIELD_NAMES == list(token._.conll_pd.index)
+        assert token._.conll_pd.to_dict() == token._.conll
+
+    for token in other_doc:
+        assert isinstance(token._.conll_pd, Series)
+        assert token._.conll_pd.to_dict() == token._.cc
+
+
+def test_token_conll_pd_disabled_pandas_after_enabled(make_hand_built_doc):
+    nlp = spacy.blank("en")
+    formatter = ConllFormatter(nlp)
+    doc = formatter(make_hand_built_doc(nlp))
+    disabled_formatter = ConllFormatter(nlp, disable_pandas=True)
+    disabled_doc = disabled_formatter(make_hand_built_doc(nlp))
+
+    for token in doc:
+        assert isinstance(token._.conll_pd, Series)
+
+    for token in disabled_doc:
+        assert token._.conll_pd is None
+
+
+def test_sents_conll_pd_different_ext_names(make_hand_built_doc):
+    nlp = spacy.blank("en")
+    formatter = ConllFormatter(nlp)
+    doc = formatter(make_hand_built_doc(nlp))
+    other_formatter = ConllFormatter(nlp, ext_names={"conll": "cc", "conll_str": "cs"})
+    other_doc = other_formatter(make_hand_built_doc(nlp))
+
+    for sent in doc.sents:
+        assert isinstance(sent._.conll_pd, DataFrame)
+        assert CONLL_FIELD_NAMES == list(sent._.conll_pd.columns)
+        assert sent._.conll_pd.to_dict("records") == sent._.conll
+
+    for sent in other_doc.sents:
+        assert isinstance(sent._.conll_pd, DataFrame)
+        assert sent._.conll_pd.to_dict("records") == sent._.cc
+
+
+def test_sents_conll_pd_disabled_pandas_after_enabled(make_hand_built_doc):
+    nlp = spacy.blank("en")
+    formatter = ConllFormatter(nlp)
+    doc = formatter(make_hand_built_doc(nlp))
+    disabled_formatter = ConllFormatter(nlp, disable_pandas=True)
+    disabled_doc = disabled_formatter(make_hand_built_doc(nlp))
+
+    for sent in doc.sents:
+        assert isinstance(sent._.conll_pd, DataFrame)
+
+    for sent in disabled_doc.sents:
+        assert sent._.conll_pd is None
+
+
+def test_conll_pd_user_extension_kept(make_hand_built_doc):
+    Token.set_extension("conll_pd", default="user value")
+    nlp = spacy.blank("en")
+    formatter = ConllFormatter(nlp)
+    doc = formatter(make_hand_built_doc(nlp))
+    ConllFormatter(nlp)(make_hand_built_doc(nlp))
+
+    for token in doc:
+        assert token._.conll_pd == "user value"
+
+
+def reset_underscore():
+    Underscore.doc_extensions = {}
+    Underscore.span_extensions = {}
+    Underscore.token_extensions = {}
+
+
+def test_reregister_after_reset_disabled_pandas_first(make_hand_built_doc):
+    nlp = spacy.blank("en")
+    formatter = ConllFormatter(nlp)
+    disabled_formatter = ConllFormatter(nlp, disable_pandas=True)
+    reset_underscore()
+
+    disabled_formatter(make_hand_built_doc(nlp))
+    doc = formatter(make_hand_built_doc(nlp))
+
+    assert isinstance(doc._.conll_pd, DataFrame)
+    for token in doc:
+        assert isinstance(token._.conll_pd, Series)
+
+
+def test_reregister_after_reset_different_conll_pd_names(make_hand_built_doc):
+    nlp = spacy.blank("en")
+    formatter = ConllFormatter(nlp)
+    other_formatter = ConllFormatter(nlp, ext_names={"conll_pd": "pandas"})
+    reset_underscore()
+
+    other_formatter(make_hand_built_doc(nlp))
+    doc = formatter(make_hand_built_doc(nlp))
+
+    assert isinstance(doc._.conll_pd, DataFrame)
+    for sent in doc.sents:
+        assert isinstance(sent._.conll_pd, DataFrame)
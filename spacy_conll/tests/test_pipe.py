@@ -0,0 +1,50 @@
+import spacy
+from spacy.tokens.underscore import Underscore
+
+from spacy_conll import ConllFormatter
+
+
+def test_pipe(base_parser, text):
+    docs = list(base_parser.pipe([text(), text()]))
+    assert len(docs) == 2
+    for doc in docs:
+        assert doc._.conll_str is not None
+        assert doc._.conll_str == base_parser(text())._.conll_str
+
+
+def assert_conll_set(doc):
+    assert isinstance(doc._.conll, list)
+    assert isinstance(doc._.conll_str, str)
+    assert doc._.conll_pd is not None
+    for sent in doc.sents:
+        assert isinstance(sent._.conll, list)
+        assert isinstance(sent._.conll_str, str)
+        assert sent._.conll_pd is not None
+    for token in doc:
+        assert isinstance(token._.conll, dict)
+        assert isinstance(token._.conll_str, str)
+        assert token._.conll_pd is not None
+
+
+def test_formatter_pipe(make_hand_built_doc):
+    nlp = spacy.blank("en")
+    formatter = ConllFormatter(nlp)
+    docs = list(formatter.pipe([make_hand_built_doc(nlp), make_hand_built_doc(nlp)]))
+    assert len(docs) == 2
+    for doc in docs:
+        assert_conll_set(doc)
+        assert doc._.conll_str == formatter(make_hand_built_doc(nlp))._.conll_str
+
+
+def test_formatter_pipe_missing_extensions(make_hand_built_doc):
+    nlp = spacy.blank("en")
+    formatter = ConllFormatter(nlp)
+    # e.g. when the formatter has been copied to another process
+    Underscore.doc_extensions = {}
+    Underscore.span_extensions = {}
+    Underscore.token_extensions = {}
+
+    docs = list(formatter.pipe([make_hand_built_doc(nlp), make_hand_built_doc(nlp)]))
+    assert len(docs) == 2
+    for doc in docs:
+        assert_conll_set(doc)